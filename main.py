@@ -2,31 +2,74 @@ import tkinter as tk
 from tkinter import ttk
 import time
 import threading
-import cv2
-from PIL import Image, ImageTk
+import queue
 import os
+from array import array
 from datetime import datetime
 
+# Configuration
+UPDATE_INTERVAL_MS = 33  # Timer display refresh interval (~30Hz)
+NAME_REFRESH_DELAY_MS = 150  # Quiet period after typing before split history redraws
+HISTORY_COLUMN_WIDTH = 12  # Characters per timer column in split history (fits 10 timers)
+EMPTY_HISTORY_CELL = " " * HISTORY_COLUMN_WIDTH
+
+# Bound once so formatting is a single call rather than per-field f-string work
+TIME_FORMAT = "{:02d}:{:02d}.{:03d}".format
+
+# Direct-mapped cache of recent format_ms results: slot = total_ms & mask,
+# each slot holding a (total_ms, text) pair. Bounded, and a hit allocates nothing.
+FORMAT_CACHE_SIZE = 2048  # Must be a power of two
+_format_cache = [None] * FORMAT_CACHE_SIZE
+
+def format_ms(total_ms):
+    """Format a whole number of milliseconds as MM:SS.mmm"""
+    # Timers started together show the same value on each tick, so most
+    # lookups after the first timer hit the cache
+    slot = total_ms & (FORMAT_CACHE_SIZE - 1)
+    entry = _format_cache[slot]
+    if entry is not None and entry[0] == total_ms:
+        return entry[1]
+        
+    # Integer divmod avoids float modulo and its rounding on long runs
+    minutes, remainder_ms = divmod(total_ms, 60000)
+    seconds, milliseconds = divmod(remainder_ms, 1000)
+    time_str = TIME_FORMAT(minutes, seconds, milliseconds)
+    _format_cache[slot] = (total_ms, time_str)
+    return time_str
+
+def format_time(elapsed_seconds):
+    """Format elapsed seconds as MM:SS.mmm"""
+    return format_ms(int(elapsed_seconds * 1000))
+
 class Timer:
     def __init__(self, parent, timer_id, parent_app):
         self.timer_id = timer_id
         self.parent = parent
         self.parent_app = parent_app
         
-        # Timer state
+        # Timer state (integer nanoseconds from time.perf_counter_ns())
         self.is_running = False
-        self.start_time = 0
-        self.elapsed_time = 0
+        self.start_time_ns = 0
+        self.elapsed_time_ns = 0
         
         # Split timer state
-        self.split_start_time = 0
-        self.split_elapsed_time = 0
+        self.split_start_time_ns = 0
+        self.split_elapsed_time_ns = 0
         self.is_split_running = False
-        self.splits = []  # List to store split times
+        self.splits = array('d')  # Split times in seconds, stored as packed doubles
+        self.split_time_strs = []  # Matching MM:SS.mmm strings, formatted once per split
+        
+        # Last millisecond value shown on each display, to skip redundant updates
+        self._last_time_ms = 0
+        self._last_split_ms = 0
         
         # Create GUI elements
         self.setup_ui()
         
+        # Truncated name shown in split history and overlays
+        self._display_name = ""
+        self._refresh_display_name()
+        
     def setup_ui(self):
         # Timer frame - minimalistic design
         self.timer_frame = ttk.Frame(self.parent, relief="solid", borderwidth=1)
@@ -36,8 +79,8 @@ class Timer:
         header_frame.grid(row=0, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(2, 0))
         
         # Timer number label
-        timer_label = ttk.Label(header_frame, text=f"#{self.timer_id}", font=("Arial", 8, "bold"))
-        timer_label.grid(row=0, column=0, padx=2, sticky=(tk.W))
+        self.timer_label = ttk.Label(header_frame, text=f"#{self.timer_id}", font=("Arial", 8, "bold"))
+        self.timer_label.grid(row=0, column=0, padx=2, sticky=(tk.W))
         
         # Name input field
         self.name_var = tk.StringVar(value=f"Timer {self.timer_id}")
@@ -52,11 +95,13 @@ class Timer:
         header_frame.columnconfigure(1, weight=1)  # Name field expands
         
         # Main timer display (larger, prominent)
-        self.time_label = ttk.Label(self.timer_frame, text="00:00.000", font=("Arial", 18, "bold"))
+        self.time_var = tk.StringVar(value="00:00.000")
+        self.time_label = ttk.Label(self.timer_frame, textvariable=self.time_var, font=("Arial", 18, "bold"))
         self.time_label.grid(row=1, column=0, columnspan=3, pady=2)
         
         # Split timer display (smaller, below main)
-        self.split_time_label = ttk.Label(self.timer_frame, text="00:00.000", font=("Arial", 10))
+        self.split_time_var = tk.StringVar(value="00:00.000")
+        self.split_time_label = ttk.Label(self.timer_frame, textvariable=self.split_time_var, font=("Arial", 10))
         self.split_time_label.grid(row=2, column=0, columnspan=3, pady=(0, 2))
         
         # Control buttons (compact horizontal row)
@@ -84,19 +129,37 @@ class Timer:
         self.name_var.trace('w', self.on_name_change)
         
     def on_name_change(self, *args):
-        """Handle name changes and update split history"""
-        self.parent_app.update_split_history()
+        """Handle name changes and schedule a split history refresh"""
+        self._refresh_display_name()
+        self.parent_app.schedule_split_history_refresh()
         
     def get_display_name(self):
         """Get the timer name with truncation for display"""
+        return self._display_name
+        
+    def _refresh_display_name(self):
+        """Recompute the cached display name from the name field"""
         name = self.name_var.get().strip()
         if not name:
             name = f"Timer {self.timer_id}"
         
         # Truncate if too long (max 12 characters to fit column width)
         if len(name) > 12:
-            return name[:9] + "..."
-        return name
+            name = name[:9] + "..."
+        self._display_name = name
+        
+    def set_id(self, new_id):
+        """Assign a new timer number and update the label and default name"""
+        self.timer_id = new_id
+        self.timer_label.config(text=f"#{new_id}")
+        
+        # Only update the name if it's still a default name (Timer X);
+        # setting it fires on_name_change, which refreshes the display name
+        current_name = self.name_var.get()
+        if current_name.startswith("Timer ") and current_name.split()[-1].isdigit():
+            self.name_var.set(f"Timer {new_id}")
+        else:
+            self._refresh_display_name()
         
     def toggle_timer(self):
         if not self.is_running:
@@ -105,15 +168,19 @@ class Timer:
             self.stop_timer()
             
     def start_timer(self):
+        now_ns = time.perf_counter_ns()
         self.is_running = True
-        self.start_time = time.perf_counter() - self.elapsed_time
+        self.start_time_ns = now_ns - self.elapsed_time_ns
         self.start_button.config(text="⏸")
         self.split_button.config(state="normal")
-        self.update_timer()
+        self.update_timer(now_ns)
+        self.parent_app.start_tick()
         
     def stop_timer(self):
         self.is_running = False
-        self.elapsed_time = time.perf_counter() - self.start_time
+        self.elapsed_time_ns = time.perf_counter_ns() - self.start_time_ns
+        # Show the exact stopped reading rather than the last tick's value
+        self.update_display(self.elapsed_time_ns // 1_000_000)
         self.start_button.config(text="▶")
         self.split_button.config(state="disabled")
         
@@ -129,67 +196,64 @@ class Timer:
             self.start_split()  # Start next split immediately
             
     def start_split(self):
+        now_ns = time.perf_counter_ns()
         self.is_split_running = True
-        self.split_start_time = time.perf_counter() - self.split_elapsed_time
+        self.split_start_time_ns = now_ns - self.split_elapsed_time_ns
         self.split_button.config(text="⏱")
-        self.update_split_timer()
+        self.update_split_timer(now_ns)
         
     def stop_split(self):
         if self.is_split_running:
             self.is_split_running = False
-            split_time = time.perf_counter() - self.split_start_time
+            # Splits are stored as floating-point seconds
+            split_time = (time.perf_counter_ns() - self.split_start_time_ns) / 1e9
             self.splits.append(split_time)
-            self.parent_app.update_split_history()  # Update the main split history
-            self.split_elapsed_time = 0  # Reset for next split
-            self.split_time_label.config(text="00:00.000")
+            self.split_time_strs.append(format_time(split_time))
+            self.parent_app.note_split_count(len(self.splits))
+            self.parent_app.append_split_row(self)  # Update the main split history
+            self.split_elapsed_time_ns = 0  # Reset for next split
+            self.update_split_display(0)
         
     def reset_timer(self):
         self.is_running = False
-        self.elapsed_time = 0
+        self.elapsed_time_ns = 0
         self.start_button.config(text="▶")
-        self.time_label.config(text="00:00.000")
+        self.update_display(0)
         
         # Reset split timer
         self.is_split_running = False
-        self.split_elapsed_time = 0
-        self.split_time_label.config(text="00:00.000")
+        self.split_elapsed_time_ns = 0
+        self.update_split_display(0)
         self.split_button.config(text="⏱", state="disabled")
         
         # Clear split history
-        self.splits = []
+        self.splits = array('d')
+        self.split_time_strs = []
+        self.parent_app.recompute_max_splits()
         self.parent_app.update_split_history()
         
-    def update_timer(self):
+    def update_timer(self, now_ns):
+        """Refresh the main display from a perf_counter_ns() reading taken by the caller"""
         if self.is_running:
-            current_time = time.perf_counter() - self.start_time
-            self.update_display(current_time)
-            # Schedule next update in 10ms (100Hz for smooth display)
-            self.parent_app.root.after(10, self.update_timer)
+            # Integer floor division keeps the display path free of float math
+            self.update_display((now_ns - self.start_time_ns) // 1_000_000)
             
-    def update_split_timer(self):
+    def update_split_timer(self, now_ns):
+        """Refresh the split display from a perf_counter_ns() reading taken by the caller"""
         if self.is_split_running and self.is_running:
-            current_split_time = time.perf_counter() - self.split_start_time
-            self.update_split_display(current_split_time)
-            # Schedule next update in 10ms (100Hz for smooth display)
-            self.parent_app.root.after(10, self.update_split_timer)
-            
-    def update_display(self, elapsed_seconds):
-        """Update the timer display with MM:SS.mmm format"""
-        minutes = int(elapsed_seconds // 60)
-        seconds = int(elapsed_seconds % 60)
-        milliseconds = int((elapsed_seconds % 1) * 1000)
-        
-        time_str = f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
-        self.time_label.config(text=time_str)
-        
-    def update_split_display(self, elapsed_seconds):
-        """Update the split timer display with MM:SS.mmm format"""
-        minutes = int(elapsed_seconds // 60)
-        seconds = int(elapsed_seconds % 60)
-        milliseconds = int((elapsed_seconds % 1) * 1000)
-        
-        time_str = f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
-        self.split_time_label.config(text=time_str)
+            self.update_split_display((now_ns - self.split_start_time_ns) // 1_000_000)
+            
+    def update_display(self, total_ms):
+        """Update the timer display with MM:SS.mmm format from whole milliseconds"""
+        if total_ms != self._last_time_ms:
+            self.time_var.set(format_ms(total_ms))
+            self._last_time_ms = total_ms
+        
+    def update_split_display(self, total_ms):
+        """Update the split timer display with MM:SS.mmm format from whole milliseconds"""
+        if total_ms != self._last_split_ms:
+            self.split_time_var.set(format_ms(total_ms))
+            self._last_split_ms = total_ms
 
     def remove_timer(self):
         """Remove this timer from the application"""
@@ -210,6 +274,16 @@ class MultiTimerApp:
         self.timers = []
         self.max_timers = 10
         
+        # Split history render state, used to append rows incrementally
+        self._rendered_split_rows = 0  # Data rows currently shown
+        self._header_dirty = True  # Whether the table needs a full redraw
+        self._max_splits = 0  # Largest split count across all timers
+        self._history_refresh_id = None  # Pending debounced refresh, if any
+        self._history_empty = True  # Whether the split history widget is blank
+        
+        # Shared display refresh loop, only scheduled while a timer is running
+        self._tick_id = None
+        
         # Video recorder
         self.video_recorder = VideoRecorder(self)
         
@@ -299,7 +373,8 @@ class MultiTimerApp:
         history_frame.grid(row=2, column=0, columnspan=2, pady=(5, 0), sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Create a compact scrollable text widget for split history
-        self.split_history = tk.Text(history_frame, height=8, width=120, font=("Consolas", 8))
+        # Read-only; the app enables it only while writing rows
+        self.split_history = tk.Text(history_frame, height=8, width=120, font=("Consolas", 8), state="disabled")
         history_scrollbar = ttk.Scrollbar(history_frame, orient="vertical", command=self.split_history.yview)
         self.split_history.configure(yscrollcommand=history_scrollbar.set)
         
@@ -327,6 +402,28 @@ class MultiTimerApp:
         self.timers_frame.bind("<Configure>", self.on_frame_configure)
         self.canvas.bind("<Configure>", self.on_canvas_configure)
         
+    def start_tick(self):
+        """Start the shared display refresh loop if it is not already scheduled"""
+        if self._tick_id is None:
+            self._tick_id = self.root.after(UPDATE_INTERVAL_MS, self._tick)
+            
+    def _tick(self):
+        """Refresh all running timer displays in a single pass"""
+        # One clock reading shared by every timer for this frame
+        now_ns = time.perf_counter_ns()
+        is_any_timer_running = False
+        for timer in self.timers:
+            if timer.is_running:
+                is_any_timer_running = True
+                timer.update_timer(now_ns)
+                timer.update_split_timer(now_ns)
+                
+        # Stop waking up once every timer is idle; start_tick re-arms the loop
+        if is_any_timer_running:
+            self._tick_id = self.root.after(UPDATE_INTERVAL_MS, self._tick)
+        else:
+            self._tick_id = None
+        
     def toggle_recording(self):
         """Toggle video recording on/off"""
         if not self.video_recorder.is_recording:
@@ -387,12 +484,7 @@ class MultiTimerApp:
             }
             
             # Add split times
-            for i, split_time in enumerate(timer.splits, 1):
-                minutes = int(split_time // 60)
-                seconds = int(split_time % 60)
-                milliseconds = int((split_time % 1) * 1000)
-                time_str = f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
-                
+            for i, (split_time, time_str) in enumerate(zip(timer.splits, timer.split_time_strs), 1):
                 timer_data["splits"].append({
                     "split_number": i,
                     "time_seconds": split_time,
@@ -404,8 +496,10 @@ class MultiTimerApp:
         # Save session data to JSON file
         session_file = os.path.join(sessions_dir, f"session_{timestamp}.json")
         try:
-            with open(session_file, 'w') as f:
-                json.dump(session_data, f, indent=2)
+            # Serialize up front so the file is written in one call
+            session_json = json.dumps(session_data, indent=2)
+            with open(session_file, 'w', encoding='utf-8') as f:
+                f.write(session_json)
             print(f"Session data saved to: {session_file}")
             
             # Show success message
@@ -480,43 +574,109 @@ class MultiTimerApp:
     def update_timer_count(self):
         self.timer_count_label.config(text=f"Timers: {len(self.timers)}/{self.max_timers}")
         
+    def note_split_count(self, split_count):
+        """Raise the running maximum split count after a timer records a split"""
+        self._max_splits = max(self._max_splits, split_count)
+        
+    def recompute_max_splits(self):
+        """Rescan all timers for the maximum split count after splits are removed"""
+        self._max_splits = max((len(timer.splits) for timer in self.timers), default=0)
+        
+    def schedule_split_history_refresh(self):
+        """Redraw the split history once typing pauses, coalescing rapid name edits"""
+        # Any split recorded before the redraw must not reuse the stale header
+        self._header_dirty = True
+        if self._history_refresh_id is not None:
+            self.root.after_cancel(self._history_refresh_id)
+        self._history_refresh_id = self.root.after(NAME_REFRESH_DELAY_MS, self._do_split_history_refresh)
+        
+    def _do_split_history_refresh(self):
+        """Run the debounced full split history redraw"""
+        self._history_refresh_id = None
+        self.update_split_history()
+        
+    def append_split_row(self, timer):
+        """Show a timer's newest split without redrawing the whole split history"""
+        if self._header_dirty:
+            self.update_split_history()
+            return
+            
+        # Local bindings for the Text operations used below, which run on every split
+        history = self.split_history
+        configure = history.configure
+        insert = history.insert
+        END = tk.END
+        
+        split_num = len(timer.splits) - 1
+        row = self._format_split_row(split_num, [t.split_time_strs for t in self.timers])
+        configure(state="normal")
+        if split_num < self._rendered_split_rows:
+            # Replace the existing row (lines 1-2 are the header and separator)
+            line = split_num + 3
+            history.delete(f"{line}.0", f"{line}.end")
+            insert(f"{line}.0", row)
+        else:
+            insert(END, row + "\n")
+            self._rendered_split_rows = split_num + 1
+        configure(state="disabled")
+        history.see(END)  # Scroll to bottom
+        
     def update_split_history(self):
-        """Update the split history display with columns for each timer"""
-        self.split_history.delete(1.0, tk.END)
+        """Redraw the whole split history table with columns for each timer"""
+        # This redraw covers any pending debounced refresh
+        if self._history_refresh_id is not None:
+            self.root.after_cancel(self._history_refresh_id)
+            self._history_refresh_id = None
+            
+        self._header_dirty = True
+        self._rendered_split_rows = 0
         
-        # Find the maximum number of splits across all timers
-        max_splits = max([len(timer.splits) for timer in self.timers]) if self.timers else 0
+        max_splits = self._max_splits
         
         if max_splits == 0:
+            # Nothing to show; only clear the widget if something is on screen
+            if not self._history_empty:
+                self.split_history.configure(state="normal")
+                self.split_history.delete(1.0, tk.END)
+                self.split_history.configure(state="disabled")
+                self._history_empty = True
             return
             
-        # Create header row with fixed column widths
-        header = "Split"
-        for timer in self.timers:
-            display_name = timer.get_display_name()
-            # Use fixed width of 12 characters for each column to fit 10 timers
-            header += f"{display_name:>12}"
-        self.split_history.insert(tk.END, header + "\n")
-        self.split_history.insert(tk.END, "-" * len(header) + "\n")
+        # Create header row with fixed-width columns so names align with the times below
+        header_cells = ["Split"]
+        header_cells.extend(timer.get_display_name().rjust(HISTORY_COLUMN_WIDTH) for timer in self.timers)
+        header = "".join(header_cells)
+        lines = [header, "-" * len(header)]
         
         # Create data rows with consistent column widths
+        timer_split_strs = [timer.split_time_strs for timer in self.timers]
         for split_num in range(max_splits):
-            row = f"{split_num + 1:>4}"
-            for timer in self.timers:
-                if split_num < len(timer.splits):
-                    split_time = timer.splits[split_num]
-                    minutes = int(split_time // 60)
-                    seconds = int(split_time % 60)
-                    milliseconds = int((split_time % 1) * 1000)
-                    time_str = f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
-                    # Use fixed width of 12 characters to match header
-                    row += f"{time_str:>12}"
-                else:
-                    # Empty cell with same width
-                    row += f"{'':>12}"
-            self.split_history.insert(tk.END, row + "\n")
+            lines.append(self._format_split_row(split_num, timer_split_strs))
             
+        # Replace the whole table with a single Text insert
+        self.split_history.configure(state="normal")
+        self.split_history.delete(1.0, tk.END)
+        self.split_history.insert(tk.END, "\n".join(lines) + "\n")
+        self.split_history.configure(state="disabled")
+        self._header_dirty = False
+        self._history_empty = False
+        self._rendered_split_rows = max_splits
         self.split_history.see(tk.END)  # Scroll to bottom
+        
+    def _format_split_row(self, split_num, timer_split_strs):
+        """Build the split history row for the given zero-based split index
+        
+        timer_split_strs holds each timer's formatted split times, in column order.
+        """
+        cells = [f"{split_num + 1:>4}"]
+        for time_strs in timer_split_strs:
+            if split_num < len(time_strs):
+                # Use fixed width to match header
+                cells.append(time_strs[split_num].rjust(HISTORY_COLUMN_WIDTH))
+            else:
+                # Empty cell with same width
+                cells.append(EMPTY_HISTORY_CELL)
+        return "".join(cells)
 
     def remove_timer(self, timer_to_remove):
         """Remove a specific timer from the timers list"""
@@ -525,13 +685,14 @@ class MultiTimerApp:
             timer_to_remove.timer_frame.destroy()
             
             # Remove from timers list
-            self.timers.remove(timer_to_remove)
-            
-            # Renumber remaining timers
-            self.renumber_timers()
+            removed_index = self.timers.index(timer_to_remove)
+            del self.timers[removed_index]
+            self.recompute_max_splits()
             
-            # Re-layout timers in the grid
-            self.relayout_timers()
+            # Timers before the removed one keep their number and grid cell,
+            # so only the ones after it need renumbering and moving
+            self.renumber_timers(removed_index)
+            self.relayout_timers(removed_index)
             
             # Update UI
             self.update_timer_count()
@@ -541,30 +702,21 @@ class MultiTimerApp:
             if len(self.timers) < self.max_timers:
                 self.add_button.config(state="normal")
                 
-    def renumber_timers(self):
-        """Renumber all timers sequentially starting from 1"""
-        for i, timer in enumerate(self.timers, 1):
-            timer.timer_id = i
-            # Update the timer number label
-            for child in timer.timer_frame.winfo_children():
-                if isinstance(child, ttk.Frame) and child.winfo_children():
-                    # Find the timer label in the header frame
-                    for header_child in child.winfo_children():
-                        if isinstance(header_child, ttk.Label) and header_child.cget("text").startswith("#"):
-                            header_child.config(text=f"#{i}")
-                            break
-            
-            # Update default name if it's still the default
-            current_name = timer.name_var.get()
-            if current_name.startswith("Timer ") and current_name.split()[-1].isdigit():
-                # Only update if it's a default name (Timer X)
-                old_num = current_name.split()[-1]
-                if old_num.isdigit():
-                    timer.name_var.set(f"Timer {i}")
+    def renumber_timers(self, start_index=0):
+        """Renumber timers sequentially starting from 1
+        
+        start_index: position in self.timers to start from; earlier timers are left as-is
+        """
+        for i in range(start_index, len(self.timers)):
+            self.timers[i].set_id(i + 1)
                             
-    def relayout_timers(self):
-        """Re-layout all timers in the grid after removal"""
-        for i, timer in enumerate(self.timers):
+    def relayout_timers(self, start_index=0):
+        """Re-layout timers in the grid after removal
+        
+        start_index: position in self.timers to start from; earlier timers are left in place
+        """
+        for i in range(start_index, len(self.timers)):
+            timer = self.timers[i]
             # Calculate new position (3 columns)
             row = i // 3
             col = i % 3
@@ -587,14 +739,29 @@ class VideoRecorder:
         self.is_recording = False
         self.cap = None
         self.video_writer = None
+        self.capture_thread = None
         self.recording_thread = None
-        self.preview_thread = None
-        self.stop_preview = False
+        
+        # Frames flow from the capture thread to the writer thread through a small
+        # bounded queue; the preview just shows whichever frame arrived last
+        self.frame_queue = queue.Queue(maxsize=2)
+        self.latest_frame = None
+        self._shown_preview_frame = None
+        self._preview_job = None
+        
+        # Last rendered overlay box with its prefix, reused while the timer name is unchanged
+        self._overlay_key = None
+        self._overlay_patch = None
+        self._overlay_origin = (0, 0)
+        self._overlay_time_x = 0  # Where the time starts, after the cached prefix
+        self._preview_photo = None  # Tk image shown in the preview, updated in place
         
         # Video settings
         self.fps = 30
         self.frame_width = 640
         self.frame_height = 480
+        self.preview_fps = 15  # Preview refresh rate; recording still captures at full fps
+        self.preview_interval_ms = 1000 // self.preview_fps
         
         # Create video directory
         self.video_dir = "recordings"
@@ -606,6 +773,9 @@ class VideoRecorder:
         if self.is_recording:
             return
             
+        # OpenCV is imported on first use so the timer UI starts without it
+        import cv2
+        
         # Initialize camera
         self.cap = cv2.VideoCapture(0)  # Use default webcam
         if not self.cap.isOpened():
@@ -623,42 +793,78 @@ class VideoRecorder:
         filepath = os.path.join(self.video_dir, filename)
         
         # Initialize video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        self.video_writer = cv2.VideoWriter(filepath, fourcc, self.fps, (self.frame_width, self.frame_height))
+        self.video_writer = self._open_video_writer(filepath)
+        if not self.video_writer.isOpened():
+            print("Error: Could not open video writer")
+            self.video_writer = None
+            self.cap.release()
+            self.cap = None
+            return
         
         self.is_recording = True
+        self.frame_queue = queue.Queue(maxsize=2)
+        self.latest_frame = None
+        
+        # Start capture thread (sole reader of the camera)
+        self.capture_thread = threading.Thread(target=self._capture_frames)
+        self.capture_thread.daemon = True
+        self.capture_thread.start()
         
         # Start recording thread
         self.recording_thread = threading.Thread(target=self._record_video)
         self.recording_thread.daemon = True
         self.recording_thread.start()
         
-        # Start preview thread
-        self.stop_preview = False
-        self.preview_thread = threading.Thread(target=self._update_preview)
-        self.preview_thread.daemon = True
-        self.preview_thread.start()
+        # Preview is refreshed from the main thread
+        self._pump_preview()
         
         print(f"Started recording: {filepath}")
         
+    def _open_video_writer(self, filepath):
+        """Open a video writer, preferring hardware-accelerated H.264 over software MPEG-4"""
+        import cv2
+        
+        frame_size = (self.frame_width, self.frame_height)
+        
+        # Let FFmpeg pick any available hardware H.264 encoder so encoding doesn't compete with the UI
+        try:
+            hw_params = [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            writer = cv2.VideoWriter(filepath, cv2.CAP_FFMPEG, cv2.VideoWriter_fourcc(*'avc1'),
+                                     self.fps, frame_size, hw_params)
+            # ACCELERATION_ANY may quietly settle for a software H.264 encoder, which
+            # costs more CPU than mp4v; only keep the writer if hardware is in use
+            if (writer.isOpened() and
+                    writer.get(cv2.VIDEOWRITER_PROP_HW_ACCELERATION) != cv2.VIDEO_ACCELERATION_NONE):
+                return writer
+            writer.release()
+        except (cv2.error, AttributeError) as e:
+            print(f"Hardware video encoding unavailable: {e}")
+            
+        print("Falling back to software MPEG-4 encoding")
+        return cv2.VideoWriter(filepath, cv2.VideoWriter_fourcc(*'mp4v'), self.fps, frame_size)
+        
     def stop_recording(self):
         """Stop video recording"""
         if not self.is_recording:
             return
             
         self.is_recording = False
-        self.stop_preview = True
         
-        # Release video writer first to stop recording thread
-        if self.video_writer:
-            self.video_writer.release()
-            self.video_writer = None
+        # Stop refreshing the preview
+        if self._preview_job is not None:
+            self.parent_app.root.after_cancel(self._preview_job)
+            self._preview_job = None
         
-        # Wait for threads to finish
+        # Wait for capture to stop, then let the writer drain the remaining frames
+        if self.capture_thread:
+            self.capture_thread.join(timeout=1)
         if self.recording_thread:
             self.recording_thread.join(timeout=1)
-        if self.preview_thread:
-            self.preview_thread.join(timeout=1)
+            
+        # Release video writer
+        if self.video_writer:
+            self.video_writer.release()
+            self.video_writer = None
             
         # Release camera
         if self.cap:
@@ -667,105 +873,163 @@ class VideoRecorder:
         
         print("Stopped recording")
         
-    def _record_video(self):
-        """Record video in separate thread"""
-        while self.is_recording and self.cap and self.video_writer:
+    def _capture_frames(self):
+        """Read camera frames in a separate thread and hand them to the writer and preview"""
+        while self.is_recording and self.cap:
             ret, frame = self.cap.read()
-            if ret and self.video_writer is not None:
-                # Add timer overlays to the frame only if recording
-                frame_with_overlays = self._add_timer_overlays(frame)
-                try:
-                    self.video_writer.write(frame_with_overlays)
-                except:
-                    # Video writer was released, stop recording
-                    break
-            else:
+            if not ret:
+                print("Error: Could not read frame from webcam")
                 break
                 
-    def _update_preview(self):
-        """Update video preview in separate thread"""
-        while not self.stop_preview and self.cap:
-            ret, frame = self.cap.read()
-            if ret:
-                # Add timer overlays to the preview frame only if recording
-                frame_with_overlays = self._add_timer_overlays(frame)
-                
-                # Convert frame for tkinter
-                frame_rgb = cv2.cvtColor(frame_with_overlays, cv2.COLOR_BGR2RGB)
-                frame_pil = Image.fromarray(frame_rgb)
-                frame_tk = ImageTk.PhotoImage(frame_pil)
+            # Add timer overlays once; the frame is shared read-only from here on
+            frame_with_overlays = self._add_timer_overlays(frame)
+            self._enqueue_frame(frame_with_overlays)
+            self.latest_frame = frame_with_overlays
+            
+        # Tell the writer thread no more frames are coming
+        self._enqueue_frame(None)
+        
+    def _enqueue_frame(self, frame):
+        """Queue a frame for the writer, dropping the oldest one if the writer has fallen behind"""
+        if self.frame_queue.full():
+            try:
+                self.frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+        self.frame_queue.put_nowait(frame)
+        
+    def _record_video(self):
+        """Write queued frames to the video file in a separate thread"""
+        while True:
+            frame = self.frame_queue.get()
+            if frame is None:
+                break
+            try:
+                self.video_writer.write(frame)
+            except Exception as e:
+                print(f"Error writing video frame: {e}")
+                break
                 
-                # Update preview in main thread
-                self.parent_app.root.after(0, self._update_preview_widget, frame_tk)
+    def _pump_preview(self):
+        """Show the most recent captured frame in the preview (main thread only)"""
+        from PIL import Image, ImageTk
+        
+        frame = self.latest_frame
+        
+        # Skip conversion work while the preview is hidden (e.g. window minimized)
+        is_preview_visible = self.parent_app.preview_label.winfo_viewable()
+        
+        if is_preview_visible and frame is not None and frame is not self._shown_preview_frame:
+            self._shown_preview_frame = frame
+            
+            # Convert frame for tkinter; Pillow's raw decoder swaps BGR to RGB as it
+            # copies the pixels, so no separate color conversion pass is needed
+            height, width = frame.shape[:2]
+            frame_pil = Image.frombytes("RGB", (width, height), frame, "raw", "BGR")
+            
+            # Paste into the existing Tk image; only create one if the size changed
+            photo = self._preview_photo
+            if photo is not None and (photo.width(), photo.height()) == frame_pil.size:
+                photo.paste(frame_pil)
             else:
-                break
+                self._preview_photo = ImageTk.PhotoImage(frame_pil)
+                self._update_preview_widget(self._preview_photo)
+            
+        self._preview_job = self.parent_app.root.after(self.preview_interval_ms, self._pump_preview)
                 
     def _add_timer_overlays(self, frame):
-        """Add timer overlays to the video frame"""
-        # Create a copy of the frame to avoid modifying the original
-        frame_with_overlays = frame.copy()
+        """Add timer overlays to the video frame
         
+        Draws in place: each captured frame is a fresh buffer that nothing else
+        reads before the overlay is applied, so no copy is needed.
+        """
         # Only add overlays if recording is active
         if not self.is_recording:
-            return frame_with_overlays
+            return frame
         
         # Get active timers and their current times
         active_timers = [timer for timer in self.parent_app.timers if timer.is_running]
         
         if not active_timers:
-            return frame_with_overlays
+            return frame
             
-        # Find the timer with the longest elapsed time
-        longest_timer = max(active_timers, key=lambda t: time.perf_counter() - t.start_time)
+        # Find the timer with the longest elapsed time (earliest effective start)
+        longest_timer = min(active_timers, key=lambda t: t.start_time_ns)
         
-        # Calculate current time for the longest timer
-        current_time = time.perf_counter() - longest_timer.start_time
-        
-        # Format time as MM:SS.mmm
-        minutes = int(current_time // 60)
-        seconds = int(current_time % 60)
-        milliseconds = int((current_time % 1) * 1000)
-        time_str = f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+        # Read the clock here rather than reusing the display text, which only
+        # updates when the UI tick runs and goes stale whenever the tick stalls
+        current_ms = (time.perf_counter_ns() - longest_timer.start_time_ns) // 1_000_000
+        time_str = format_ms(current_ms)
         
         # Get timer name
         timer_name = longest_timer.get_display_name()
         
-        # Create overlay text
-        overlay_text = f"{timer_name}: {time_str}"
+        # Create overlay text prefix; the time is drawn after it
+        overlay_prefix = f"{timer_name}: "
         
         # Position for the timer (single overlay)
         overlay_x = 10
         overlay_y = 120  # Moved down to avoid top quarter
         
         # Add text overlay with background
-        self._add_text_overlay(frame_with_overlays, overlay_text, overlay_x, overlay_y)
+        self._add_text_overlay(frame, overlay_prefix, time_str, overlay_x, overlay_y)
             
-        return frame_with_overlays
+        return frame
+        
+    def _add_text_overlay(self, frame, prefix, time_str, x, y):
+        """Add text overlay with background to the frame
+        
+        The time changes on every frame, so only the background box with the
+        prefix drawn on it is cached; each frame copies that box in and draws
+        just the time with putText.
+        """
+        import cv2
         
-    def _add_text_overlay(self, frame, text, x, y):
-        """Add text overlay with background to the frame"""
         # Font settings
         font = cv2.FONT_HERSHEY_SIMPLEX
         font_scale = 0.7
         thickness = 2
         color = (255, 255, 255)  # White text
-        bg_color = (0, 0, 0)     # Black background
-        
-        # Get text size
-        (text_width, text_height), baseline = cv2.getTextSize(text, font, font_scale, thickness)
-        
-        # Calculate background rectangle
-        padding = 5
-        rect_x1 = x - padding
-        rect_y1 = y - text_height - padding
-        rect_x2 = x + text_width + padding
-        rect_y2 = y + baseline + padding
         
-        # Draw background rectangle
-        cv2.rectangle(frame, (rect_x1, rect_y1), (rect_x2, rect_y2), bg_color, -1)
-        
-        # Draw text
-        cv2.putText(frame, text, (x, y), font, font_scale, color, thickness)
+        # All digits share one advance width in this font, so the box only
+        # changes with the prefix or the length of the time string
+        key = (prefix, len(time_str), x, y)
+        if key != self._overlay_key:
+            import numpy as np
+            
+            # Get text size
+            (text_width, text_height), baseline = cv2.getTextSize(prefix + time_str, font, font_scale, thickness)
+            (prefix_width, _), _ = cv2.getTextSize(prefix, font, font_scale, thickness)
+            
+            # Calculate background rectangle (corners inclusive, as cv2.rectangle draws them)
+            padding = 5
+            rect_x1 = max(x - padding, 0)
+            rect_y1 = max(y - text_height - padding, 0)
+            rect_x2 = x + text_width + padding
+            rect_y2 = y + baseline + padding
+            
+            # Black background with the prefix drawn at the same spot it would have in the frame
+            patch = np.zeros((rect_y2 - rect_y1 + 1, rect_x2 - rect_x1 + 1, 3), dtype=np.uint8)
+            cv2.putText(patch, prefix, (x - rect_x1, y - rect_y1), font, font_scale, color, thickness)
+            
+            self._overlay_patch = patch
+            self._overlay_origin = (rect_x1, rect_y1)
+            # Where putText would continue after the prefix, so the time lands exactly
+            # where it does when the whole string is drawn at once
+            self._overlay_time_x = x + prefix_width - thickness // 2
+            self._overlay_key = key
+            
+        # Copy the cached box onto the frame, clipped to the frame edges
+        patch = self._overlay_patch
+        left, top = self._overlay_origin
+        frame_height, frame_width = frame.shape[:2]
+        patch_height = min(patch.shape[0], frame_height - top)
+        patch_width = min(patch.shape[1], frame_width - left)
+        if patch_height > 0 and patch_width > 0:
+            frame[top:top + patch_height, left:left + patch_width] = patch[:patch_height, :patch_width]
+            
+        # Draw the time after the prefix
+        cv2.putText(frame, time_str, (self._overlay_time_x, y), font, font_scale, color, thickness)
         
     def _update_preview_widget(self, frame_tk):
         """Update preview widget in main thread"""